@@ -10,7 +10,6 @@ import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -18,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from github_client import GitHubClient
 from analyzer import WorkflowAnalyzer
 from dashboard import DashboardGenerator
+from report import write_dashboard, sync_images
 
 
 def get_target_org():
@@ -77,16 +77,8 @@ def main():
         
         print(f"Analyzing {len(repos)} repositories...")
         
-        # Collect workflow runs
-        all_runs = []
-        for i, repo in enumerate(repos, 1):
-            print(f"[{i}/{len(repos)}] Analyzing {repo}...")
-            try:
-                runs = github_client.get_all_repository_runs(repo, ANALYSIS_DAYS)
-                all_runs.extend(runs)
-                print(f"  Found {len(runs)} workflow runs")
-            except Exception as e:
-                print(f"  Error: {e}")
+        # Collect workflow runs concurrently (the work is I/O-bound on the GitHub API)
+        all_runs = github_client.get_runs_for_repositories(repos, ANALYSIS_DAYS)
         
         if not all_runs:
             print("ERROR: No workflow runs found")
@@ -104,34 +96,21 @@ def main():
         summary = dashboard_gen.generate_summary_stats(stats, repo_summary, {})
         
         # Render HTML template
-        template_dir = Path(__file__).parent / 'templates'
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template('dashboard.html')
-        
-        repositories = list(set(s.repository for s in stats))
-        
-        html_content = template.render(
+        # The summary keys are already the unique repositories
+        repositories = list(repo_summary)
+
+        # Save output for GitHub Pages
+        write_dashboard(
             title=f"{org} - Workflow Performance Dashboard",
             charts=charts,
             summary=summary,
             workflows=stats,
-            repositories=repositories
+            repositories=repositories,
+            output_path=OUTPUT_PATH
         )
         
-        # Save output for GitHub Pages
-        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
         # Copy images directory for logo
-        import shutil
-        images_src = Path(__file__).parent / 'images'
-        images_dst = OUTPUT_PATH.parent / 'images'
-        if images_src.exists():
-            if images_dst.exists():
-                shutil.rmtree(images_dst)
-            shutil.copytree(images_src, images_dst)
-            print(f"Copied images to {images_dst}")
+        sync_images(OUTPUT_PATH.parent / 'images')
         
     except Exception as e:
         print(f"ERROR: Error during analysis: {e}")
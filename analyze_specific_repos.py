@@ -5,11 +5,12 @@ GitHub Workflow Analyzer for specific repositories
 Modified version to analyze only specific repositories instead of entire organization.
 """
 
+import hashlib
 import os
+import pickle
 import sys
 from pathlib import Path
-from datetime import datetime
-from jinja2 import Environment, FileSystemLoader
+from datetime import date, datetime
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
@@ -17,6 +18,41 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from github_client import GitHubClient
 from analyzer import WorkflowAnalyzer
 from dashboard import DashboardGenerator
+from report import write_dashboard, sync_images
+
+# On-disk cache for fetched runs so same-day reruns skip the GitHub API
+_RUN_CACHE_DIR = Path('.run_cache')
+
+
+def get_runs_with_cache(github_client, repos, days):
+    """Fetch runs for the given repos, reusing today's on-disk cache if present.
+
+    The cache key covers the repo list, the analysis window and today's
+    date, so it naturally invalidates on date rollover or config changes.
+    """
+    digest = hashlib.blake2b(
+        repr((sorted(repos), days, date.today().isoformat())).encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_path = _RUN_CACHE_DIR / f"runs_{digest}.pkl"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                runs = pickle.load(f)
+            print(f"Loaded {len(runs)} workflow runs from cache ({cache_path})")
+            return runs
+        except Exception as e:
+            print(f"Ignoring unreadable run cache: {e}")
+
+    runs = github_client.get_runs_for_repositories(repos, days)
+
+    if runs:
+        _RUN_CACHE_DIR.mkdir(exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump(runs, f)
+
+    return runs
 
 
 def main():
@@ -57,16 +93,9 @@ def main():
         analyzer = WorkflowAnalyzer(DURATION_THRESHOLD)
         dashboard_gen = DashboardGenerator("Specific Repositories - Workflow Performance Dashboard")
         
-        # Collect workflow runs from specific repositories
-        all_runs = []
-        for i, repo in enumerate(SPECIFIC_REPOS, 1):
-            print(f"[{i}/{len(SPECIFIC_REPOS)}] Analyzing {repo}...")
-            try:
-                runs = github_client.get_all_repository_runs(repo, ANALYSIS_DAYS)
-                all_runs.extend(runs)
-                print(f"  Found {len(runs)} workflow runs")
-            except Exception as e:
-                print(f"  Error: {e}")
+        # Collect workflow runs from specific repositories concurrently,
+        # short-circuiting to the on-disk cache on same-day reruns
+        all_runs = get_runs_with_cache(github_client, SPECIFIC_REPOS, ANALYSIS_DAYS)
         
         if not all_runs:
             print("ERROR: No workflow runs found")
@@ -84,34 +113,21 @@ def main():
         summary = dashboard_gen.generate_summary_stats(stats, repo_summary, {})
         
         # Render HTML template
-        template_dir = Path(__file__).parent / 'templates'
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template('dashboard.html')
-        
-        repositories = list(set(s.repository for s in stats))
-        
-        html_content = template.render(
+        # The summary keys are already the unique repositories
+        repositories = list(repo_summary)
+
+        # Save output
+        write_dashboard(
             title="Specific Repositories - Workflow Performance Dashboard",
             charts=charts,
             summary=summary,
             workflows=stats,
-            repositories=repositories
+            repositories=repositories,
+            output_path=OUTPUT_PATH
         )
         
-        # Save output
-        OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
         # Copy images directory for logo
-        import shutil
-        images_src = Path(__file__).parent / 'images'
-        images_dst = OUTPUT_PATH.parent / 'images'
-        if images_src.exists():
-            if images_dst.exists():
-                shutil.rmtree(images_dst)
-            shutil.copytree(images_src, images_dst)
-            print(f"Copied images to {images_dst}")
+        sync_images(OUTPUT_PATH.parent / 'images')
         
         print(f"Dashboard generated successfully: {OUTPUT_PATH}")
         print("Open the dashboard in your browser to view the results.")
@@ -1,11 +1,75 @@
-from typing import List, Dict
-from datetime import datetime
-from collections import defaultdict
-from dataclasses import dataclass
+import sys
+from typing import List, Dict, Optional
+from datetime import date, datetime
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
+from heapq import nlargest
+from itertools import groupby
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+
+import numpy as np
+
 from github_client import WorkflowRun
 
 
-@dataclass
+class Priority(IntEnum):
+    """Optimization priority for a workflow.
+
+    An IntEnum keeps comparisons and sorting plain integer ops (the old
+    string values needed a separate rank field to sort on) while str()
+    still yields the lowercase name the dashboard renders.
+    """
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+# GitHub event names that classify a workflow as PR- or push-triggered
+_PR_EVENTS = frozenset({'pull_request', 'pull_request_target', 'pull_request_review', 'pull_request_review_comment'})
+_PUSH_EVENTS = frozenset({'push'})
+
+
+@lru_cache(maxsize=4096)
+def _analyze_triggers_cached(trigger_signature, events, many_runs):
+    """Build the trigger analysis for one hashable trigger signature.
+
+    Workflows copied between repos share identical trigger configurations,
+    so the analysis is memoized on the signature. The result is wrapped in
+    a read-only mapping because cache entries are shared between callers.
+    """
+    if trigger_signature is not None:
+        analysis = dict(trigger_signature)
+    else:
+        # Fallback to event-based analysis; set intersection replaces the
+        # per-event substring scans with hashed membership tests
+        events_set = frozenset(events)
+        analysis = {
+            'is_pr_triggered': not events_set.isdisjoint(_PR_EVENTS),
+            'is_push_triggered': not events_set.isdisjoint(_PUSH_EVENTS),
+            'trigger_frequency_score': 0
+        }
+
+        if analysis['is_pr_triggered']:
+            analysis['trigger_frequency_score'] += 3
+        if analysis['is_push_triggered']:
+            analysis['trigger_frequency_score'] += 2
+
+    # Determine if it's high frequency based on trigger analysis and run count
+    analysis['is_high_frequency_trigger'] = (
+        analysis.get('trigger_frequency_score', 0) >= 3 or  # PR/Push triggered
+        many_runs  # More than 10 runs in analysis period
+    )
+
+    return MappingProxyType(analysis)
+
+
+@dataclass(slots=True, frozen=True)
 class WorkflowStats:
     workflow_name: str
     repository: str
@@ -22,7 +86,13 @@ class WorkflowStats:
     is_push_triggered: bool = False
     is_high_frequency_trigger: bool = False
     trigger_frequency_score: float = 0.0
-    optimization_priority: str = "low"
+    optimization_priority: Priority = Priority.LOW
+    # Repository name without the org prefix, derived once; the chart
+    # builders read it per row
+    short_name: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'short_name', self.repository.rpartition('/')[2])
 
 
 class WorkflowAnalyzer:
@@ -31,52 +101,69 @@ class WorkflowAnalyzer:
     
     def analyze_workflows(self, runs: List[WorkflowRun]) -> List[WorkflowStats]:
         """Analyze workflow runs and return statistics."""
-        # Group runs by workflow and repository
-        workflow_groups = defaultdict(list)
-        
+        # Intern the key strings: an org has at most hundreds of unique
+        # repo/workflow names but many thousands of runs referencing them,
+        # so grouping, set building and sorting all hit the interned
+        # pointer-equality fast path (and duplicate strings collapse to one)
         for run in runs:
-            key = (run.repository, run.workflow_name)
-            workflow_groups[key].append(run)
-        
+            run.repository = sys.intern(run.repository)
+            run.workflow_name = sys.intern(run.workflow_name)
+
+        # Group runs by repository and workflow: one sort followed by groupby
+        # streams each group without building an intermediate dict of lists
+        group_key = attrgetter('repository', 'workflow_name')
+        runs_sorted = sorted(runs, key=group_key)
+
         stats = []
-        
-        for (repo, workflow_name), workflow_runs in workflow_groups.items():
-            if len(workflow_runs) == 0:
-                continue
-            
-            # Calculate statistics
-            durations_minutes = [r.duration_seconds / 60 for r in workflow_runs]
-            avg_duration = sum(durations_minutes) / len(durations_minutes)
-            max_duration = max(durations_minutes)
-            min_duration = min(durations_minutes)
-            
+
+        for (repo, workflow_name), group in groupby(runs_sorted, key=group_key):
+            workflow_runs = list(group)
+
+            # Fill the per-group arrays and the event set in one traversal of
+            # the runs; the reductions then run in C on the filled arrays
+            n_runs = len(workflow_runs)
+            durations_minutes = np.empty(n_runs, dtype=np.float64)
+            ordinals = np.empty(n_runs, dtype=np.int64)
+            events_set = set()
+            for i, run in enumerate(workflow_runs):
+                durations_minutes[i] = run.duration_minutes
+                ordinals[i] = run.created_at.toordinal()
+                events_set.add(run.event)
+
+            avg_duration = float(durations_minutes.mean())
+            max_duration = float(durations_minutes.max())
+            min_duration = float(durations_minutes.min())
+
             # Calculate frequency score (runs per day)
-            days_span = self._calculate_days_span(workflow_runs)
-            frequency_score = len(workflow_runs) / max(days_span, 1)
-            
-            # Analyze triggers from workflow content
-            trigger_analysis = self._analyze_workflow_triggers(workflow_runs)
+            days_span = max(int(ordinals.max() - ordinals.min()), 1)
+            frequency_score = n_runs / days_span
             
+            # Analyze triggers from workflow content; bind the flags once
+            # instead of re-probing the dict at every use below
+            trigger_analysis = self._analyze_workflow_triggers(workflow_runs, events_set)
+            is_pr_triggered = trigger_analysis['is_pr_triggered']
+            is_push_triggered = trigger_analysis['is_push_triggered']
+
             # Enhanced frequency score based on trigger analysis
             enhanced_frequency_score = frequency_score
-            if trigger_analysis['is_pr_triggered'] or trigger_analysis['is_push_triggered']:
+            if is_pr_triggered or is_push_triggered:
                 enhanced_frequency_score *= 1.5  # Boost score for PR/push triggered workflows
             
             # Determine optimization priority
-            optimization_priority = self._determine_optimization_priority(
+            priority = self._determine_optimization_priority(
                 avg_duration, enhanced_frequency_score, trigger_analysis
             )
             
-            # Get trigger events
-            events = list(set(r.event for r in workflow_runs))
+            # Get trigger events (already collected during the array fill)
+            events = list(events_set)
             
-            # Sort runs by recency
-            recent_runs = sorted(workflow_runs, key=lambda x: x.created_at, reverse=True)[:10]
+            # Keep the 10 most recent runs: O(n log 10) instead of a full sort
+            recent_runs = nlargest(10, workflow_runs, key=attrgetter('created_at'))
             
             workflow_stat = WorkflowStats(
                 workflow_name=workflow_name,
                 repository=repo,
-                total_runs=len(workflow_runs),
+                total_runs=n_runs,
                 avg_duration_minutes=avg_duration,
                 max_duration_minutes=max_duration,
                 min_duration_minutes=min_duration,
@@ -84,23 +171,19 @@ class WorkflowAnalyzer:
                 frequency_score=enhanced_frequency_score,
                 trigger_events=events,
                 recent_runs=recent_runs,
-                is_pr_triggered=trigger_analysis['is_pr_triggered'],
-                is_push_triggered=trigger_analysis['is_push_triggered'],
+                is_pr_triggered=is_pr_triggered,
+                is_push_triggered=is_push_triggered,
                 is_high_frequency_trigger=trigger_analysis['is_high_frequency_trigger'],
                 trigger_frequency_score=trigger_analysis['trigger_frequency_score'],
-                optimization_priority=optimization_priority
+                optimization_priority=priority
             )
             
             stats.append(workflow_stat)
         
-        # Sort by priority (critical > high > medium > low), then by duration (longest first within same priority)
-        def sort_key(workflow):
-            priority_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-            priority_score = priority_order.get(workflow.optimization_priority, 0)
-            # Return negative priority so higher priority comes first, positive duration so longer comes first
-            return (-priority_score, -workflow.avg_duration_minutes)
-        
-        return sorted(stats, key=sort_key)
+        # Sort by priority (critical > high > medium > low), then by duration
+        # (longest first within same priority). Priority is an IntEnum so the
+        # sort key is a plain C-level attribute fetch and integer compare.
+        return sorted(stats, key=attrgetter('optimization_priority', 'avg_duration_minutes'), reverse=True)
     
     def get_repository_summary(self, stats: List[WorkflowStats]) -> Dict[str, Dict]:
         """Get summary statistics by repository."""
@@ -109,62 +192,126 @@ class WorkflowAnalyzer:
             'problematic_workflows': 0,
             'avg_duration': 0,
             'total_runs': 0,
-            'workflows': []
+            'workflows': [],
+            '_duration_sum': 0.0
         })
-        
+
         for stat in stats:
-            repo = stat.repository
-            repo_stats[repo]['total_workflows'] += 1
-            repo_stats[repo]['total_runs'] += stat.total_runs
-            repo_stats[repo]['workflows'].append(stat)
-            
-            if (
-                # Most impactful: Frequent (PR/Push) workflows that are slow (>10min)
-                ((stat.is_pr_triggered or stat.is_push_triggered) and stat.avg_duration_minutes > 10) or
-                # Also include: Frequent workflows that are moderately slow (>5min)
-                ((stat.is_pr_triggered or stat.is_push_triggered) and stat.avg_duration_minutes > 5) or
-                # Also include: Extremely slow workflows regardless of trigger (>15min)
-                stat.avg_duration_minutes > 15
-            ):
-                repo_stats[repo]['problematic_workflows'] += 1
-        
-        # Calculate average durations
-        for repo, data in repo_stats.items():
-            if data['workflows']:
-                data['avg_duration'] = sum(w.avg_duration_minutes for w in data['workflows']) / len(data['workflows'])
-        
+            data = repo_stats[stat.repository]
+            data['total_workflows'] += 1
+            data['total_runs'] += stat.total_runs
+            data['workflows'].append(stat)
+            data['_duration_sum'] += stat.avg_duration_minutes
+
+            # Problematic: frequent (PR/Push) workflows that are moderately
+            # slow (>5min, which subsumes the >10min case), or extremely slow
+            # workflows regardless of trigger (>15min)
+            is_frequent = stat.is_pr_triggered or stat.is_push_triggered
+            duration = stat.avg_duration_minutes
+            if (is_frequent and duration > 5) or duration > 15:
+                data['problematic_workflows'] += 1
+
+        # Finalize average durations from the running sums
+        for data in repo_stats.values():
+            data['avg_duration'] = data.pop('_duration_sum') / data['total_workflows']
+
         return dict(repo_stats)
     
-    def get_trend_analysis(self, runs: List[WorkflowRun], days: int = 15) -> Dict:
-        """Analyze trends over time (kept for backward compatibility)."""
+    def get_trend_analysis(self, runs: List[WorkflowRun], days: int = 15,
+                           stats: Optional[List[WorkflowStats]] = None) -> Dict:
+        """Analyze daily trends over the analysis window.
+
+        Runs are bucketed by calendar day with np.unique and the per-day
+        count/average/maximum come from C-level reductions, so the cost per
+        run stays flat even for six-figure run counts. Pass the stats
+        returned by analyze_workflows to reuse its workflow count instead of
+        rescanning every run.
+        """
+        if stats is not None:
+            total_workflows = len(stats)
+        else:
+            total_workflows = len({r.workflow_name for r in runs}) if runs else 0
+
+        daily_trends = []
+        if runs:
+            n_runs = len(runs)
+            ordinals = np.empty(n_runs, dtype=np.int64)
+            durations = np.empty(n_runs, dtype=np.float64)
+            for i, run in enumerate(runs):
+                ordinals[i] = run.created_at.toordinal()
+                durations[i] = run.duration_minutes
+
+            # unique_days comes out sorted; inverse maps each run to its day
+            # bucket for the grouped reductions
+            unique_days, inverse, counts = np.unique(ordinals, return_inverse=True, return_counts=True)
+            sums = np.bincount(inverse, weights=durations)
+            order = np.argsort(inverse, kind='stable')
+            segment_starts = np.searchsorted(inverse[order], np.arange(len(unique_days)))
+            maxima = np.maximum.reduceat(durations[order], segment_starts)
+
+            daily_trends = [
+                {
+                    'date': date.fromordinal(int(day)).isoformat(),
+                    'total_runs': int(count),
+                    'avg_duration_minutes': float(total / count),
+                    'max_duration_minutes': float(peak)
+                }
+                for day, count, total, peak in zip(unique_days, counts, sums, maxima)
+            ]
+
         return {
-            'daily_trends': [],
+            'daily_trends': daily_trends,
             'total_analysis_days': days,
             'total_runs': len(runs),
-            'total_workflows': len(set(r.workflow_name for r in runs)) if runs else 0
+            'total_workflows': total_workflows
         }
     
-    def get_workflow_patterns(self, stats: List[WorkflowStats]) -> Dict:
-        """Analyze patterns in workflow triggers and timing (kept for backward compatibility)."""
+    def get_workflow_patterns(self, stats: Optional[List[WorkflowStats]] = None,
+                              runs: Optional[List[WorkflowRun]] = None) -> Dict:
+        """Analyze patterns in workflow triggers and timing.
+
+        Pass the full runs list when the caller has it: the stats-based
+        fallback only sees the 10 most recent runs kept per workflow, so
+        its patterns are biased toward the tail of each group. Event totals
+        come from a single C-level Counter pass and the hourly averages from
+        bincount reductions, instead of per-run dict updates.
+        """
+        if runs is not None:
+            all_runs = runs
+        else:
+            all_runs = [run for stat in stats for run in stat.recent_runs]
+
+        trigger_events = Counter(map(attrgetter('event'), all_runs))
+
+        hourly_avg = {}
+        if all_runs:
+            hours = np.fromiter(
+                (r.created_at.hour for r in all_runs), dtype=np.int64, count=len(all_runs)
+            )
+            durations = np.fromiter(
+                (r.duration_minutes for r in all_runs), dtype=np.float64, count=len(all_runs)
+            )
+            counts = np.bincount(hours, minlength=24)
+            sums = np.bincount(hours, weights=durations, minlength=24)
+            hourly_avg = {hour: float(sums[hour] / counts[hour])
+                          for hour in range(24) if counts[hour]}
+
+        # Top 5 hours without sorting all 24 buckets
+        peak_hours = nlargest(5, hourly_avg.items(), key=itemgetter(1))
+
         return {
-            'trigger_events': {},
-            'hourly_patterns': {},
-            'peak_hours': []
+            'trigger_events': dict(trigger_events),
+            'hourly_patterns': hourly_avg,
+            'peak_hours': peak_hours
         }
     
-    def _calculate_days_span(self, runs: List[WorkflowRun]) -> int:
-        """Calculate the number of days spanned by the workflow runs."""
-        if not runs:
-            return 1
-        
-        dates = [r.created_at.date() for r in runs]
-        min_date = min(dates)
-        max_date = max(dates)
-        
-        return max((max_date - min_date).days, 1)
-    
-    def _analyze_workflow_triggers(self, runs: List[WorkflowRun]) -> Dict[str, any]:
-        """Analyze triggers from workflow runs."""
+    def _analyze_workflow_triggers(self, runs: List[WorkflowRun],
+                                   events_set: Optional[set] = None) -> Dict[str, any]:
+        """Analyze triggers from workflow runs.
+
+        Pass the event set if the caller already collected it (as the main
+        analysis loop does) to avoid re-deriving it from the runs.
+        """
         if not runs:
             return {
                 'is_pr_triggered': False,
@@ -172,62 +319,42 @@ class WorkflowAnalyzer:
                 'is_high_frequency_trigger': False,
                 'trigger_frequency_score': 0.0
             }
-        
-        # Get trigger analysis from the first run (should be consistent across runs)
+
+        # Get trigger analysis from the first run (should be consistent across
+        # runs), frozen into a hashable signature for the memoized helper
         first_run = runs[0]
-        if hasattr(first_run, 'trigger_analysis') and first_run.trigger_analysis:
-            analysis = first_run.trigger_analysis.copy()
+        explicit = getattr(first_run, 'trigger_analysis', None)
+        if explicit:
+            trigger_signature = tuple(sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in explicit.items()
+            ))
         else:
-            # Fallback to event-based analysis
-            events = [run.event for run in runs]
-            analysis = {
-                'is_pr_triggered': any('pull_request' in event for event in events),
-                'is_push_triggered': any('push' in event for event in events),
-                'trigger_frequency_score': 0
-            }
-            
-            if analysis['is_pr_triggered']:
-                analysis['trigger_frequency_score'] += 3
-            if analysis['is_push_triggered']:
-                analysis['trigger_frequency_score'] += 2
-        
-        # Determine if it's high frequency based on trigger analysis and run count
-        analysis['is_high_frequency_trigger'] = (
-            analysis.get('trigger_frequency_score', 0) >= 3 or  # PR/Push triggered
-            len(runs) > 10  # More than 10 runs in analysis period
-        )
-        
-        return analysis
+            trigger_signature = None
+
+        if events_set is None:
+            events_set = {run.event for run in runs}
+        events = tuple(sorted(events_set))
+        return _analyze_triggers_cached(trigger_signature, events, len(runs) > 10)
     
-    def _determine_optimization_priority(self, avg_duration: float, frequency_score: float, trigger_analysis: Dict) -> str:
+    def _determine_optimization_priority(self, avg_duration: float, frequency_score: float, trigger_analysis: Dict) -> Priority:
         """
-        Determine optimization priority based on the most impactful workflows:
+        Determine the optimization priority based on the most impactful
+        workflows:
         - Frequently run workflows (PR/Push triggered) that take >10 minutes
         - Focus on workflows that directly impact developer productivity
         """
-        
-        is_pr_triggered = trigger_analysis.get('is_pr_triggered', False)
-        is_push_triggered = trigger_analysis.get('is_push_triggered', False)
-        is_frequent = is_pr_triggered or is_push_triggered  # These run frequently
-        
-        # CRITICAL: Most impactful workflows - frequent (PR/Push) + slow (>10min)
-        # These directly block developers and deployments
-        if is_frequent and avg_duration > 10:
-            return "critical"
-        
-        # HIGH: Either frequent workflows that are moderately slow (>5min)
-        # OR very slow workflows regardless of frequency (>15min)
-        if is_frequent and avg_duration > 5:
-            return "high"
-        if avg_duration > 15:  # Extremely slow workflows impact CI/CD resources
-            return "high"
-        
-        # MEDIUM: Frequent workflows that could be optimized further
-        # OR background workflows that are slow but don't block developers
-        if is_frequent:  # Fast PR/Push workflows - still worth optimizing
-            return "medium"
-        if avg_duration > 10:  # Slow background workflows (nightly builds, etc.)
-            return "medium"
-        
-        # LOW: Everything else
-        return "low"
\ No newline at end of file
+        is_frequent = (trigger_analysis.get('is_pr_triggered', False) or
+                       trigger_analysis.get('is_push_triggered', False))
+
+        # critical: frequent (PR/Push) + slow (>10min) - these directly
+        #   block developers and deployments
+        # high: frequent and moderately slow (>5min), or extremely slow
+        #   regardless of trigger (>15min)
+        # medium: fast frequent workflows still worth optimizing, or slow
+        #   background workflows (nightly builds, etc.) that don't block anyone
+        # low: everything else
+        return (Priority.CRITICAL if is_frequent and avg_duration > 10 else
+                Priority.HIGH if (is_frequent and avg_duration > 5) or avg_duration > 15 else
+                Priority.MEDIUM if is_frequent or avg_duration > 10 else
+                Priority.LOW)
\ No newline at end of file
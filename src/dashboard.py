@@ -1,353 +1,593 @@
-from typing import List, Dict
-from analyzer import WorkflowStats
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from heapq import nlargest
+from operator import itemgetter
+from typing import Iterator, List, Dict, Optional
 
+import jinja2
+import numpy as np
 
-class DashboardGenerator:
-    def __init__(self, title: str = "GitHub Workflow Performance Dashboard"):
-        self.title = title
-    
-    def generate_charts(self, stats: List[WorkflowStats], repo_summary: Dict, trends: Dict, patterns: Dict) -> Dict[str, str]:
-        """Generate simplified charts focusing on actionable workflows."""
-        charts = {}
-        
-        # 1. Top Problematic Workflows - What needs to be fixed
-        charts['top_workflows'] = self._create_top_problematic_workflows_chart(stats)
-        
-        # 2. Repository Scorecard - Performance Grades
-        charts['repository_scorecard'] = self._create_repository_scorecard(repo_summary)
-        
-        # 3. Monthly Resource Usage by Component - Team focus analysis
-        charts['monthly_usage'] = self._create_monthly_usage_chart(stats)
-        
-        return charts
-    
-    def _create_top_problematic_workflows_chart(self, stats: List[WorkflowStats]) -> str:
-        """Create a simple list of top problematic workflows that need attention."""
-        if not stats:
-            return "<p>No workflow data available</p>"
-        
-        # Filter to problematic workflows and take top 20
-        problematic_workflows = [s for s in stats if s.optimization_priority in ['critical', 'high']]
-        top_workflows = problematic_workflows[:20]
-        
-        if not top_workflows:
-            return """
-            <div style="font-family: 'Segoe UI', Arial, sans-serif; background: white; padding: 25px; border-radius: 10px; border: 1px solid #ddd; text-align: center;">
-                <h3 style="color: #4caf50; margin-bottom: 15px;">
-                    <i class="fas fa-check-circle" style="margin-right: 10px;"></i>
+from analyzer import Priority, WorkflowStats
+
+# Style tuples are (css_class, icon, label); the colors live in _CHART_CSS.
+_PRIORITY_STYLES = {
+    Priority.CRITICAL: ("critical", "🔴", "CRITICAL"),
+    Priority.HIGH: ("high", "🟠", "HIGH"),
+}
+
+# Usage-percentage bands for the monthly chart; a style index is picked by
+# bisecting the thresholds (>=20 high, >=10 medium, >=5 moderate, else low)
+_USAGE_THRESHOLDS = (5, 10, 20)
+_USAGE_STYLES = (
+    ("usage-low", "🟢", "LOW USAGE"),
+    ("usage-moderate", "🔵", "MODERATE USAGE"),
+    ("usage-medium", "🟡", "MEDIUM USAGE"),
+    ("usage-high", "🔴", "HIGH USAGE"),
+)
+
+# Scorecard severity bands, same bisect scheme as the usage styles
+# (>=50 high risk, >=25 needs attention, >0 minor issues, else healthy)
+_SEVERITY_THRESHOLDS = (0, 25, 50)
+_SEVERITY_STYLES = (
+    ("sev-healthy", "HEALTHY"),
+    ("sev-minor", "MINOR ISSUES"),
+    ("sev-attention", "NEEDS ATTENTION"),
+    ("sev-risk", "HIGH RISK"),
+)
+
+# All chart styling in one static block, emitted as the first chunk of each
+# chart so every chart stays self-contained when dropped into the page via
+# |safe. Rows carry short class names and the band classes swap the two
+# custom properties the colored pieces read, so the per-row markup shrinks
+# to the handful of values that actually vary.
+_CHART_CSS = """
+        <style>
+        .gwa-panel{font-family:'Segoe UI',Arial,sans-serif;background:white;padding:25px;border-radius:10px;border:1px solid #ddd}
+        .gwa-center{text-align:center}
+        .gwa-title{margin-top:0;color:#151515;border-bottom:2px solid #06c;padding-bottom:15px;display:flex;align-items:center}
+        .gwa-title i{color:#06c;margin-right:10px}
+        .gwa-title.gwa-alert{border-bottom-color:#c9190b}
+        .gwa-title.gwa-alert i{color:#c9190b}
+        .gwa-ok{color:#4caf50;margin-bottom:15px}
+        .gwa-ok i{margin-right:10px}
+        .gwa-muted{color:#666;margin:0}
+        .gwa-note{margin-bottom:20px;padding:15px;background:#e7f1fa;border-left:4px solid #06c;border-radius:4px}
+        .gwa-note.gwa-warn{background:#fdf2d0;border-left-color:#f0ab00}
+        .gwa-scroll{max-height:500px;overflow-y:auto;padding-right:10px;scrollbar-width:thin;scrollbar-color:#e0e0e0 transparent}
+        .gwa-scroll.gwa-tall{max-height:600px}
+        .gwa-scroll.gwa-short{max-height:400px}
+        .gwa-card{--accent:#3e8635;--band:#f3faf2;margin-bottom:15px;padding:15px;background:var(--band);border-left:4px solid var(--accent);border-radius:6px}
+        .gwa-card.critical,.gwa-card.usage-high,.gwa-card.sev-risk{--accent:#c9190b;--band:#faeae8}
+        .gwa-card.high,.gwa-card.usage-medium,.gwa-card.sev-attention{--accent:#f0ab00;--band:#fdf2d0}
+        .gwa-card.usage-moderate{--accent:#06c;--band:#e7f1fa}
+        .gwa-card.sev-minor{--accent:#6a6e73;--band:#f0f0f0}
+        .gwa-card.gwa-repo{border:1px solid #e9ecef;border-left:4px solid var(--accent)}
+        .gwa-split{display:flex;justify-content:space-between;align-items:flex-start}
+        .gwa-split.gwa-middle{align-items:center}
+        .gwa-main{flex:1}
+        .gwa-head{display:flex;align-items:center;margin-bottom:8px}
+        .gwa-icon{font-size:1.1em;margin-right:8px}
+        .gwa-badge{background:var(--accent);color:white;padding:2px 8px;border-radius:12px;font-size:0.75em;font-weight:bold;margin-right:10px}
+        .gwa-name{color:#151515;font-size:1.1em}
+        .gwa-repo-name{margin:0 10px 0 0;color:#151515;font-size:1.1em}
+        .gwa-wf-name{color:#151515;font-size:1.05em;font-weight:500;margin-bottom:6px}
+        .gwa-detail{color:#6a6e73;font-size:0.9em;margin-bottom:8px}
+        .gwa-fine{color:#6a6e73;font-size:0.85em}
+        .gwa-side{text-align:right;margin-left:15px}
+        .gwa-stat{background:var(--accent);color:white;padding:6px 10px;border-radius:4px;font-size:0.9em;font-weight:bold;margin-bottom:4px}
+        .gwa-stat-label{font-size:0.7em;color:#6a6e73}
+        .gwa-pct{font-size:1.4em;font-weight:bold;color:var(--accent);margin-bottom:2px}
+        .gwa-ratio{font-size:0.9em;color:#151515;font-weight:500}
+        .gwa-track{background:#f0f0f0;border-radius:10px;height:8px;overflow:hidden;margin-bottom:8px}
+        .gwa-bar{background:var(--accent);height:100%;border-radius:10px;transition:width 0.3s ease}
+        .gwa-sublist{margin-top:10px;padding:8px;background:rgba(255,255,255,0.7);border-radius:4px}
+        .gwa-sublist-title{font-size:0.8em;color:#6a6e73;margin-bottom:5px}
+        .gwa-subrow{font-size:0.75em;color:#151515;margin-bottom:2px}
+        .gwa-usage-stat{background:var(--accent);color:white;padding:8px 12px;border-radius:6px;margin-bottom:5px}
+        .gwa-usage-pct{font-size:1.2em;font-weight:bold}
+        .gwa-usage-cap{font-size:0.7em}
+        </style>
+"""
+
+# Fixed chart chrome: the empty-state block, the three chart headers (the
+# top-workflows one takes the problematic count) and the shared footer.
+# Hoisted so each render reuses the same string objects.
+_NO_WORKFLOW_DATA_HTML = "<p>No workflow data available</p>"
+_NO_REPO_DATA_HTML = "<p>No repository data available</p>"
+_NO_USAGE_DATA_HTML = "<p>No resource consumption data available</p>"
+
+_ALL_OPTIMIZED_HTML = """
+            <div class="gwa-panel gwa-center">
+                <h3 class="gwa-ok">
+                    <i class="fas fa-check-circle"></i>
                     All Workflows Optimized!
                 </h3>
-                <p style="color: #666; margin: 0;">No critical or high priority workflow issues found. Your CI/CD is well optimized!</p>
+                <p class="gwa-muted">No critical or high priority workflow issues found. Your CI/CD is well optimized!</p>
             </div>
             """
-        
-        html_content = f"""
-        <div style="font-family: 'Segoe UI', Arial, sans-serif; background: white; padding: 25px; border-radius: 10px; border: 1px solid #ddd;">
-            <h3 style="margin-top: 0; color: #151515; border-bottom: 2px solid #c9190b; padding-bottom: 15px; display: flex; align-items: center;">
-                <i class="fas fa-exclamation-triangle" style="color: #c9190b; margin-right: 10px;"></i>
+
+_TOP_HEADER_FMT = """
+        <div class="gwa-panel">
+            <h3 class="gwa-title gwa-alert">
+                <i class="fas fa-exclamation-triangle"></i>
                 Top Problematic Workflows
             </h3>
-            <div style="margin-bottom: 20px; padding: 15px; background: #fdf2d0; border-left: 4px solid #f0ab00; border-radius: 4px;">
-                <strong>Found {len(problematic_workflows)} workflows needing attention.</strong> 
+            <div class="gwa-note gwa-warn">
+                <strong>Found %d workflows needing attention.</strong>
                 These workflows are either slow (>10min) and frequent (PR/Push triggered) or extremely slow (>15min).
             </div>
-            <div style="max-height: 600px; overflow-y: auto; padding-right: 10px; scrollbar-width: thin; scrollbar-color: #e0e0e0 transparent;">
+            <div class="gwa-scroll gwa-tall">
         """
-        
-        for i, workflow in enumerate(top_workflows, 1):
-            repo_name = workflow.repository.split('/')[-1]
-            
-            # Determine priority styling (OpenShift colors)
-            if workflow.optimization_priority == 'critical':
-                priority_color = "#c9190b"  # OpenShift danger color
-                priority_bg = "#faeae8"     # Light danger background
-                priority_icon = "🔴"
-                priority_label = "CRITICAL"
-            else:  # high
-                priority_color = "#f0ab00"  # OpenShift warning color
-                priority_bg = "#fdf2d0"     # Light warning background
-                priority_icon = "🟠"
-                priority_label = "HIGH"
-            
-            # Calculate daily impact
-            daily_impact = workflow.avg_duration_minutes * workflow.frequency_score
-            
-            html_content += f"""
-            <div style="margin-bottom: 15px; padding: 15px; background: {priority_bg}; border-left: 4px solid {priority_color}; border-radius: 6px;">
-                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                    <div style="flex: 1;">
-                        <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                            <span style="font-size: 1.1em; margin-right: 8px;">{priority_icon}</span>
-                            <span style="background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.75em; font-weight: bold; margin-right: 10px;">
-                                #{i} {priority_label}
-                            </span>
-                            <strong style="color: #333; font-size: 1.1em;">{repo_name}</strong>
-                        </div>
-                        <div style="color: #333; font-size: 1.05em; font-weight: 500; margin-bottom: 6px;">
-                            {workflow.workflow_name}
+
+_SCORECARD_HEADER = """
+        <div class="gwa-panel">
+            <h3 class="gwa-title">
+                <i class="fas fa-trophy"></i>
+                Repository Performance Scorecard
+            </h3>
+            <div class="gwa-scroll gwa-short">
+        """
+
+_USAGE_HEADER = """
+        <div class="gwa-panel">
+            <h3 class="gwa-title">
+                <i class="fas fa-chart-pie"></i>
+                Monthly CI/CD Resource Usage by Component
+            </h3>
+            <div class="gwa-note">
+                <strong>Resource allocation analysis</strong> - Shows which teams/components consume the most CI/CD resources over a month.
+                Focus optimization efforts on high-usage components for maximum impact.
+            </div>
+            <div class="gwa-scroll">
+        """
+
+_CHART_FOOTER = """
+            </div>
+        </div>
+        """
+
+# Per-row templates, compiled once per generator. Autoescape covers the
+# dynamic fields (workflow and repository names come straight from the
+# GitHub API); everything constant lives in _CHART_CSS, so each row only
+# interpolates the band class and its handful of values.
+_WORKFLOW_ROW_HTML = """
+            <div class="gwa-card {{ band }}">
+                <div class="gwa-split">
+                    <div class="gwa-main">
+                        <div class="gwa-head">
+                            <span class="gwa-icon">{{ icon }}</span>
+                            <span class="gwa-badge">#{{ i }} {{ label }}</span>
+                            <strong class="gwa-name">{{ repo_name }}</strong>
                         </div>
-                        <div style="color: #666; font-size: 0.9em; margin-bottom: 8px;">
-                            <strong>Duration:</strong> {workflow.avg_duration_minutes:.1f} minutes • 
-                            <strong>Frequency:</strong> {workflow.frequency_score:.1f} runs/day
+                        <div class="gwa-wf-name">{{ workflow.workflow_name }}</div>
+                        <div class="gwa-detail">
+                            <strong>Duration:</strong> {{ "%.1f"|format(workflow.avg_duration_minutes) }} minutes &bull;
+                            <strong>Frequency:</strong> {{ "%.1f"|format(workflow.frequency_score) }} runs/day
                         </div>
-                        <div style="color: #666; font-size: 0.85em;">
-                            <strong>Repository:</strong> {workflow.repository}
+                        <div class="gwa-fine">
+                            <strong>Repository:</strong> {{ workflow.repository }}
                         </div>
                     </div>
-                    <div style="text-align: right; margin-left: 15px;">
-                        <div style="background: {priority_color}; color: white; padding: 6px 10px; border-radius: 4px; font-size: 0.9em; font-weight: bold; margin-bottom: 4px;">
-                            {workflow.avg_duration_minutes:.1f}m
-                        </div>
-                        <div style="font-size: 0.7em; color: #666;">avg duration</div>
+                    <div class="gwa-side">
+                        <div class="gwa-stat">{{ "%.1f"|format(workflow.avg_duration_minutes) }}m</div>
+                        <div class="gwa-stat-label">avg duration</div>
                     </div>
                 </div>
             </div>
-            """
-        
-        html_content += """
-            </div>
-        </div>
-        """
-        
-        return html_content
+"""
 
-    def _create_repository_scorecard(self, repo_summary: Dict) -> str:
-        """Create a repository scorecard showing performance grades for each repository."""
-        if not repo_summary:
-            return "<p>No repository data available</p>"
-        
-        html_content = """
-        <div style="font-family: 'Segoe UI', Arial, sans-serif; background: white; padding: 25px; border-radius: 10px; border: 1px solid #ddd;">
-            <h3 style="margin-top: 0; color: #151515; border-bottom: 2px solid #06c; padding-bottom: 15px; display: flex; align-items: center;">
-                <i class="fas fa-trophy" style="color: #06c; margin-right: 10px;"></i>
-                Repository Performance Scorecard
-            </h3>
-            <div style="max-height: 400px; overflow-y: auto; padding-right: 10px; scrollbar-width: thin; scrollbar-color: #e0e0e0 transparent;">
-        """
-        
-        # Sort repositories by percentage of problematic workflows, then by count (most problematic first)
-        def sort_key(item):
-            repo_name, data = item
-            total = data['total_workflows']
-            problematic = data['problematic_workflows']
-            percentage = (problematic / total * 100) if total > 0 else 0
-            return (-percentage, -problematic)  # Negative for descending order
-        
-        sorted_repos = sorted(repo_summary.items(), key=sort_key)
-        
-        for repo_name, data in sorted_repos:
-            total_workflows = data['total_workflows']
-            problematic_workflows = data['problematic_workflows']
-            short_name = repo_name.split('/')[-1]
-            
-            # Calculate percentage
-            percentage = (problematic_workflows / total_workflows * 100) if total_workflows > 0 else 0
-            
-            # Determine color based on problem severity
-            if percentage >= 50:
-                severity_color = "#c9190b"  # OpenShift danger red
-                severity_bg = "#faeae8"
-                severity_label = "HIGH RISK"
-            elif percentage >= 25:
-                severity_color = "#f0ab00"  # OpenShift warning yellow
-                severity_bg = "#fdf2d0"
-                severity_label = "NEEDS ATTENTION"
-            elif percentage > 0:
-                severity_color = "#6a6e73"  # OpenShift gray
-                severity_bg = "#f0f0f0"
-                severity_label = "MINOR ISSUES"
-            else:
-                severity_color = "#3e8635"  # OpenShift success green
-                severity_bg = "#f3faf2"
-                severity_label = "HEALTHY"
-            
-            html_content += f"""
-            <div style="margin-bottom: 15px; padding: 15px; background: {severity_bg}; border-radius: 6px; border: 1px solid #e9ecef; border-left: 4px solid {severity_color};">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div style="flex: 1;">
-                        <div style="display: flex; align-items: center; margin-bottom: 5px;">
-                            <h4 style="margin: 0; color: #151515; font-size: 1.1em; margin-right: 10px;">{short_name}</h4>
-                            <span style="background: {severity_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.7em; font-weight: bold;">
-                                {severity_label}
-                            </span>
+_REPO_ROW_HTML = """
+            <div class="gwa-card gwa-repo {{ band }}">
+                <div class="gwa-split gwa-middle">
+                    <div class="gwa-main">
+                        <div class="gwa-head">
+                            <h4 class="gwa-repo-name">{{ short_name }}</h4>
+                            <span class="gwa-badge">{{ label }}</span>
                         </div>
-                        <div style="color: #6a6e73; font-size: 0.85em; margin-top: 2px;">{repo_name}</div>
+                        <div class="gwa-fine">{{ repo_name }}</div>
                     </div>
-                    <div style="text-align: right;">
-                        <div style="font-size: 1.4em; font-weight: bold; color: {severity_color}; margin-bottom: 2px;">
-                            {percentage:.0f}%
-                        </div>
-                        <div style="font-size: 0.9em; color: #151515; font-weight: 500;">
-                            {problematic_workflows} / {total_workflows}
-                        </div>
-                        <div style="font-size: 0.75em; color: #6a6e73;">problems / total</div>
+                    <div class="gwa-side">
+                        <div class="gwa-pct">{{ "%.0f"|format(percentage) }}%</div>
+                        <div class="gwa-ratio">{{ problematic_workflows }} / {{ total_workflows }}</div>
+                        <div class="gwa-stat-label">problems / total</div>
                     </div>
                 </div>
             </div>
-            """
-        
-        html_content += """
-            </div>
-        </div>
-        """
-        
-        return html_content
-    
-    def _create_monthly_usage_chart(self, stats: List[WorkflowStats]) -> str:
-        """Create a chart showing monthly resource usage percentage by component/workflow."""
-        if not stats:
-            return "<p>No workflow data available</p>"
-        
-        # Calculate total monthly resource consumption (frequency * duration for all workflows)
-        total_monthly_consumption = sum(s.frequency_score * s.avg_duration_minutes * 30 for s in stats)  # 30 days
-        
-        if total_monthly_consumption == 0:
-            return "<p>No resource consumption data available</p>"
-        
-        # Group by repository/component and calculate consumption percentage
-        component_usage = {}
-        for stat in stats:
-            repo_name = stat.repository.split('/')[-1]  # Get component name
-            monthly_consumption = stat.frequency_score * stat.avg_duration_minutes * 30
-            percentage = (monthly_consumption / total_monthly_consumption) * 100
-            
-            if repo_name not in component_usage:
-                component_usage[repo_name] = {
-                    'percentage': 0,
-                    'total_minutes': 0,
-                    'workflow_count': 0,
-                    'workflows': []
-                }
-            
-            component_usage[repo_name]['percentage'] += percentage
-            component_usage[repo_name]['total_minutes'] += monthly_consumption
-            component_usage[repo_name]['workflow_count'] += 1
-            component_usage[repo_name]['workflows'].append({
-                'name': stat.workflow_name,
-                'percentage': percentage,
-                'frequency': stat.frequency_score,
-                'duration': stat.avg_duration_minutes
-            })
-        
-        # Sort by usage percentage (highest first)
-        sorted_components = sorted(component_usage.items(), key=lambda x: x[1]['percentage'], reverse=True)
-        
-        html_content = """
-        <div style="font-family: 'Segoe UI', Arial, sans-serif; background: white; padding: 25px; border-radius: 10px; border: 1px solid #ddd;">
-            <h3 style="margin-top: 0; color: #151515; border-bottom: 2px solid #06c; padding-bottom: 15px; display: flex; align-items: center;">
-                <i class="fas fa-chart-pie" style="color: #06c; margin-right: 10px;"></i>
-                Monthly CI/CD Resource Usage by Component
-            </h3>
-            <div style="margin-bottom: 20px; padding: 15px; background: #e7f1fa; border-left: 4px solid #06c; border-radius: 4px;">
-                <strong>Resource allocation analysis</strong> - Shows which teams/components consume the most CI/CD resources over a month. 
-                Focus optimization efforts on high-usage components for maximum impact.
-            </div>
-            <div style="max-height: 500px; overflow-y: auto; padding-right: 10px; scrollbar-width: thin; scrollbar-color: #e0e0e0 transparent;">
-        """
-        
-        for i, (component, data) in enumerate(sorted_components, 1):
-            percentage = data['percentage']
-            total_hours = data['total_minutes'] / 60
-            workflow_count = data['workflow_count']
-            
-            # Determine visual priority based on usage percentage
-            if percentage >= 20:
-                priority_color = "#c9190b"  # High usage - red
-                priority_bg = "#faeae8"
-                priority_icon = "🔴"
-                priority_label = "HIGH USAGE"
-            elif percentage >= 10:
-                priority_color = "#f0ab00"  # Medium usage - yellow
-                priority_bg = "#fdf2d0"
-                priority_icon = "🟡"
-                priority_label = "MEDIUM USAGE"
-            elif percentage >= 5:
-                priority_color = "#06c"  # Moderate usage - blue
-                priority_bg = "#e7f1fa"
-                priority_icon = "🔵"
-                priority_label = "MODERATE USAGE"
-            else:
-                priority_color = "#3e8635"  # Low usage - green
-                priority_bg = "#f3faf2"
-                priority_icon = "🟢"
-                priority_label = "LOW USAGE"
-            
-            # Create visual percentage bar
-            bar_width = min(percentage * 4, 100)  # Scale for visual representation
-            
-            html_content += f"""
-            <div style="margin-bottom: 15px; padding: 15px; background: {priority_bg}; border-left: 4px solid {priority_color}; border-radius: 6px;">
-                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                    <div style="flex: 1;">
-                        <div style="display: flex; align-items: center; margin-bottom: 8px;">
-                            <span style="font-size: 1.1em; margin-right: 8px;">{priority_icon}</span>
-                            <span style="background: {priority_color}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.75em; font-weight: bold; margin-right: 10px;">
-                                #{i} {priority_label}
-                            </span>
-                            <strong style="color: #151515; font-size: 1.1em;">{component}</strong>
+"""
+
+_COMPONENT_ROW_HTML = """
+            <div class="gwa-card {{ band }}">
+                <div class="gwa-split">
+                    <div class="gwa-main">
+                        <div class="gwa-head">
+                            <span class="gwa-icon">{{ icon }}</span>
+                            <span class="gwa-badge">#{{ i }} {{ label }}</span>
+                            <strong class="gwa-name">{{ component }}</strong>
                         </div>
-                        <div style="color: #6a6e73; font-size: 0.9em; margin-bottom: 8px;">
-                            <strong>Monthly Usage:</strong> {total_hours:.1f} hours • 
-                            <strong>Workflows:</strong> {workflow_count} active workflows
+                        <div class="gwa-detail">
+                            <strong>Monthly Usage:</strong> {{ "%.1f"|format(total_hours) }} hours &bull;
+                            <strong>Workflows:</strong> {{ workflow_count }} active workflows
                         </div>
-                        <div style="background: #f0f0f0; border-radius: 10px; height: 8px; overflow: hidden; margin-bottom: 8px;">
-                            <div style="background: {priority_color}; height: 100%; width: {bar_width}%; border-radius: 10px; transition: width 0.3s ease;"></div>
+                        <div class="gwa-track">
+                            <div class="gwa-bar" style="width: {{ bar_width }}%;"></div>
                         </div>
-            """
-            
-            # Show top 3 workflows for this component if it's a high usage component
-            if percentage >= 5 and len(data['workflows']) > 1:
-                top_workflows = sorted(data['workflows'], key=lambda x: x['percentage'], reverse=True)[:3]
-                html_content += """
-                        <div style="margin-top: 10px; padding: 8px; background: rgba(255,255,255,0.7); border-radius: 4px;">
-                            <div style="font-size: 0.8em; color: #6a6e73; margin-bottom: 5px;"><strong>Top Workflows:</strong></div>
-                """
-                for workflow in top_workflows:
-                    html_content += f"""
-                            <div style="font-size: 0.75em; color: #151515; margin-bottom: 2px;">
-                                • {workflow['name'][:40]}{'...' if len(workflow['name']) > 40 else ''} 
-                                ({workflow['percentage']:.1f}% - {workflow['frequency']:.1f}/day, {workflow['duration']:.1f}min)
+                        {% if top_workflows %}
+                        <div class="gwa-sublist">
+                            <div class="gwa-sublist-title"><strong>Top Workflows:</strong></div>
+                            {% for workflow in top_workflows %}
+                            <div class="gwa-subrow">
+                                &bull; {{ workflow.name[:40] }}{% if workflow.name|length > 40 %}...{% endif %}
+                                ({{ "%.1f"|format(workflow.percentage) }}% - {{ "%.1f"|format(workflow.frequency) }}/day, {{ "%.1f"|format(workflow.duration) }}min)
                             </div>
-                    """
-                html_content += """
+                            {% endfor %}
                         </div>
-                """
-            
-            html_content += f"""
+                        {% endif %}
                     </div>
-                    <div style="text-align: right; margin-left: 15px;">
-                        <div style="background: {priority_color}; color: white; padding: 8px 12px; border-radius: 6px; margin-bottom: 5px;">
-                            <div style="font-size: 1.2em; font-weight: bold;">{percentage:.1f}%</div>
-                            <div style="font-size: 0.7em;">of total usage</div>
-                        </div>
-                        <div style="font-size: 0.8em; color: #6a6e73;">
-                            {total_hours:.0f}h/month
+                    <div class="gwa-side">
+                        <div class="gwa-usage-stat">
+                            <div class="gwa-usage-pct">{{ "%.1f"|format(percentage) }}%</div>
+                            <div class="gwa-usage-cap">of total usage</div>
                         </div>
+                        <div class="gwa-fine">{{ "%.0f"|format(total_hours) }}h/month</div>
                     </div>
                 </div>
             </div>
-            """
-        
-        html_content += """
-            </div>
-        </div>
+"""
+
+
+class _LazyCharts(Mapping):
+    """Chart mapping that renders each chart on first access.
+
+    Callers that only read one chart (a single-chart endpoint, or the
+    template when a section is disabled) never pay for the others; the
+    rendered HTML is memoized so repeated reads stay cheap.
+    """
+
+    def __init__(self, builders):
+        self._builders = builders
+        self._rendered = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._rendered[key]
+        except KeyError:
+            value = self._rendered[key] = self._builders[key]()
+            return value
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
+
+
+class DashboardGenerator:
+    def __init__(self, title: str = "GitHub Workflow Performance Dashboard"):
+        self.title = title
+        # Compile the row templates once; rendering them in the loops
+        # replaces per-row f-string assembly and escapes the dynamic fields
+        self._env = jinja2.Environment(autoescape=True, auto_reload=False)
+        self._workflow_row_tmpl = self._env.from_string(_WORKFLOW_ROW_HTML)
+        self._repo_row_tmpl = self._env.from_string(_REPO_ROW_HTML)
+        self._component_row_tmpl = self._env.from_string(_COMPONENT_ROW_HTML)
+        # Rendered-chart cache for repeated generations over unchanged data
+        # (e.g. timer-driven refreshes); keyed by a cheap content digest
+        self._chart_cache = OrderedDict()
+
+    @staticmethod
+    def _stats_digest(stats: List[WorkflowStats], repo_summary: Dict) -> int:
+        """Cheap content key for the chart cache.
+
+        Covers every rendered input: the per-stat fields the rows show
+        (including frequency score and priority, which can change with the
+        trigger configuration while run counts stay the same) and the
+        per-repo workflow counts behind the scorecard.
         """
-        
-        return html_content
+        return hash((
+            tuple((s.repository, s.workflow_name, s.total_runs, s.avg_duration_minutes,
+                   s.frequency_score, s.optimization_priority)
+                  for s in stats),
+            tuple(sorted(
+                (name, data['total_workflows'], data['problematic_workflows'])
+                for name, data in repo_summary.items()
+            ))
+        ))
+
+    def generate_charts(self, stats: List[WorkflowStats], repo_summary: Dict, trends: Dict, patterns: Dict,
+                        as_html: bool = True) -> Mapping:
+        """Generate simplified charts focusing on actionable workflows.
+
+        The returned mapping is lazy: each chart is built on first access,
+        so callers that touch a subset only pay for that subset. Pass
+        as_html=False to get the plain data dicts the HTML is rendered
+        from (e.g. for a JSON endpoint) without any HTML assembly.
+        """
+        digest = (self._stats_digest(stats, repo_summary), as_html)
+        cached = self._chart_cache.get(digest)
+        if cached is not None:
+            self._chart_cache.move_to_end(digest)
+            return cached
+
+        if as_html:
+            charts = _LazyCharts({
+                # 1. Top Problematic Workflows - What needs to be fixed
+                'top_workflows': lambda: self._render_top_problematic_html(
+                    self._compute_top_problematic_data(stats)),
+                # 2. Repository Scorecard - Performance Grades
+                'repository_scorecard': lambda: self._render_scorecard_html(
+                    self._compute_scorecard_data(repo_summary)),
+                # 3. Monthly Resource Usage by Component - Team focus analysis
+                'monthly_usage': lambda: self._render_monthly_usage_html(
+                    self._compute_monthly_usage_data(stats)),
+            })
+        else:
+            charts = _LazyCharts({
+                'top_workflows': lambda: self._compute_top_problematic_data(stats),
+                'repository_scorecard': lambda: self._compute_scorecard_data(repo_summary),
+                'monthly_usage': lambda: self._compute_monthly_usage_data(stats),
+            })
+
+        self._chart_cache[digest] = charts
+        if len(self._chart_cache) > 4:
+            self._chart_cache.popitem(last=False)
+
+        return charts
+
+    def _compute_top_problematic_data(self, stats: List[WorkflowStats]) -> Dict:
+        """Collect the top problematic workflows as plain data rows.
+
+        The analyzer returns stats sorted by priority then duration, so the
+        problematic (critical/high) workflows form a prefix: count them in
+        one early-exiting scan and keep the first 20 - no filtered copy of
+        the whole list and no re-sort.
+        """
+        rows = []
+        problematic_count = 0
+        for stat in stats:
+            if stat.optimization_priority < Priority.HIGH:
+                break
+            problematic_count += 1
+            if problematic_count <= 20:
+                rows.append({
+                    'workflow_name': stat.workflow_name,
+                    'repository': stat.repository,
+                    'short_name': stat.short_name,
+                    'avg_duration_minutes': stat.avg_duration_minutes,
+                    'frequency_score': stat.frequency_score,
+                    'priority': stat.optimization_priority,
+                })
+        return {'rows': rows, 'count': problematic_count, 'has_data': bool(stats)}
+
+    def _render_top_problematic_html(self, data: Dict) -> str:
+        """Render the top-problematic-workflows data as the styled chart."""
+        return ''.join(self._iter_top_problematic_html(data))
+
+    def _iter_top_problematic_html(self, data: Dict) -> Iterator[str]:
+        """Yield the top-problematic chart as chunks (header, rows, footer).
+
+        Streaming callers can write each chunk straight to a response or
+        file; peak memory stays at one row instead of the whole chart.
+        """
+        if not data['has_data']:
+            yield _NO_WORKFLOW_DATA_HTML
+            return
+
+        yield _CHART_CSS
+        if not data['rows']:
+            yield _ALL_OPTIMIZED_HTML
+            return
+
+        yield _TOP_HEADER_FMT % data['count']
+
+        for i, row in enumerate(data['rows'], 1):
+            band, icon, label = _PRIORITY_STYLES[row['priority']]
+
+            yield self._workflow_row_tmpl.render(
+                i=i,
+                workflow=row,
+                repo_name=row['short_name'],
+                band=band,
+                icon=icon,
+                label=label
+            )
+
+        yield _CHART_FOOTER
+
+    def _compute_scorecard_data(self, repo_summary: Dict) -> Dict:
+        """Grade each repository and order them worst-first as plain data.
+
+        Decorate-sort: the percentage is computed once per repo instead of
+        on every comparison, and itemgetter dispatches in C rather than
+        through a lambda.
+        """
+        decorated = []
+        for repo_name, data in repo_summary.items():
+            total = data['total_workflows']
+            problematic = data['problematic_workflows']
+            percentage = (problematic / total * 100) if total > 0 else 0
+            decorated.append((percentage, problematic, repo_name, total))
+        decorated.sort(key=itemgetter(0, 1), reverse=True)
+
+        return {'rows': [
+            {
+                'repository': repo_name,
+                'short_name': repo_name.rpartition('/')[2],
+                'percentage': percentage,
+                'problematic_workflows': problematic,
+                'total_workflows': total,
+            }
+            for percentage, problematic, repo_name, total in decorated
+        ]}
+
+    def _render_scorecard_html(self, data: Dict) -> str:
+        """Render the scorecard data as the styled chart."""
+        return ''.join(self._iter_scorecard_html(data))
+
+    def _iter_scorecard_html(self, data: Dict) -> Iterator[str]:
+        """Yield the scorecard as chunks (header, rows, footer)."""
+        if not data['rows']:
+            yield _NO_REPO_DATA_HTML
+            return
+
+        yield _CHART_CSS
+        yield _SCORECARD_HEADER
+
+        for row in data['rows']:
+            percentage = row['percentage']
+
+            # Determine the severity band; the zero check keeps the strict
+            # >0 boundary of the MINOR ISSUES band
+            band, label = _SEVERITY_STYLES[
+                bisect_right(_SEVERITY_THRESHOLDS, percentage) if percentage else 0
+            ]
+
+            yield self._repo_row_tmpl.render(
+                repo_name=row['repository'],
+                short_name=row['short_name'],
+                percentage=percentage,
+                problematic_workflows=row['problematic_workflows'],
+                total_workflows=row['total_workflows'],
+                band=band,
+                label=label
+            )
+
+        yield _CHART_FOOTER
+    
+    def _compute_monthly_usage_data(self, stats: List[WorkflowStats]) -> Dict:
+        """Aggregate monthly resource usage per component as plain data."""
+        # Group by repository/component in a single pass, accumulating raw
+        # frequency*duration minutes; the 30-day scaling and the percentage
+        # division both happen once at the end instead of per stat. Buckets
+        # are plain lists [monthly_minutes, workflow_count, rows] and rows
+        # are (name, daily_minutes, frequency, duration) tuples - denser
+        # than a dict per bucket and a dict per workflow.
+        component_usage = defaultdict(lambda: [0.0, 0, []])
+        total_daily_minutes = 0.0
+        for stat in stats:
+            repo_name = stat.short_name  # Component name, derived once by the analyzer
+            daily_minutes = stat.frequency_score * stat.avg_duration_minutes
+            total_daily_minutes += daily_minutes
+
+            bucket = component_usage[repo_name]
+            bucket[0] += daily_minutes * 30
+            bucket[1] += 1
+            bucket[2].append((stat.workflow_name, daily_minutes, stat.frequency_score, stat.avg_duration_minutes))
+
+        if total_daily_minutes == 0:
+            return {'components': [], 'has_data': bool(stats)}
+
+        total_monthly_consumption = total_daily_minutes * 30
+
+        # Vectorize the per-component arithmetic: the percentages, hours and
+        # bar widths come from three array ops, and argsort on the minutes
+        # yields the render order (identical to sorting on percentage)
+        components = list(component_usage.items())
+        monthly_minutes = np.fromiter(
+            (bucket[0] for _, bucket in components), dtype=np.float64, count=len(components)
+        )
+        pcts = monthly_minutes / total_monthly_consumption * 100
+        bar_widths = np.minimum(pcts * 4, 100.0)  # Scale for visual representation
+        hours = monthly_minutes / 60.0
+        order = np.argsort(-monthly_minutes, kind='stable')
+
+        components_data = []
+        for idx in order:
+            component, (_, workflow_count, rows) = components[idx]
+            percentage = float(pcts[idx])
+
+            # Show top 3 workflows for this component if it's a high usage
+            # component; only those rows get expanded to the dict shape
+            if percentage >= 5 and len(rows) > 1:
+                top_workflows = [
+                    {'name': name, 'percentage': daily_minutes / total_daily_minutes * 100,
+                     'frequency': frequency, 'duration': duration}
+                    for name, daily_minutes, frequency, duration
+                    in nlargest(3, rows, key=itemgetter(1))
+                ]
+            else:
+                top_workflows = []
+
+            components_data.append({
+                'name': component,
+                'percentage': percentage,
+                'total_hours': float(hours[idx]),
+                'bar_width': float(bar_widths[idx]),
+                'workflow_count': workflow_count,
+                'top_workflows': top_workflows,
+            })
+
+        return {'components': components_data, 'has_data': True}
+
+    def _render_monthly_usage_html(self, data: Dict) -> str:
+        """Render the monthly usage data as the styled chart."""
+        return ''.join(self._iter_monthly_usage_html(data))
+
+    def _iter_monthly_usage_html(self, data: Dict) -> Iterator[str]:
+        """Yield the monthly usage chart as chunks (header, rows, footer)."""
+        if not data['has_data']:
+            yield _NO_WORKFLOW_DATA_HTML
+            return
+        if not data['components']:
+            yield _NO_USAGE_DATA_HTML
+            return
+
+        yield _CHART_CSS
+        yield _USAGE_HEADER
+
+        for i, component in enumerate(data['components'], 1):
+            # Determine the usage band from the percentage
+            band, icon, label = \
+                _USAGE_STYLES[bisect_right(_USAGE_THRESHOLDS, component['percentage'])]
+
+            yield self._component_row_tmpl.render(
+                i=i,
+                component=component['name'],
+                percentage=component['percentage'],
+                total_hours=component['total_hours'],
+                workflow_count=component['workflow_count'],
+                bar_width=component['bar_width'],
+                top_workflows=component['top_workflows'],
+                band=band,
+                icon=icon,
+                label=label
+            )
+
+        yield _CHART_FOOTER
     
-    def generate_summary_stats(self, stats: List[WorkflowStats], repo_summary: Dict, trends: Dict) -> Dict:
-        """Generate summary statistics for the dashboard."""
+    def generate_summary_stats(self, stats: List[WorkflowStats], repo_summary: Dict, trends: Dict,
+                               problematic_count: Optional[int] = None) -> Dict:
+        """Generate summary statistics for the dashboard.
+
+        Callers that already have the problematic count (it is the 'count'
+        field of the top-workflows chart data) can pass it to skip the
+        recount over stats.
+        """
         from datetime import datetime
-        
+
+        # One fill pass over the stats, then C-level reductions, instead of
+        # a list comprehension plus two generator sums
         total_workflows = len(stats)
-        problematic_workflows = len([s for s in stats if s.optimization_priority in ['critical', 'high']])
-        
-        avg_duration = sum(s.avg_duration_minutes for s in stats) / len(stats) if stats else 0
-        total_runs = sum(s.total_runs for s in stats)
+        if stats:
+            durations = np.empty(total_workflows, dtype=np.float64)
+            run_counts = np.empty(total_workflows, dtype=np.int64)
+            for i, stat in enumerate(stats):
+                durations[i] = stat.avg_duration_minutes
+                run_counts[i] = stat.total_runs
+            if problematic_count is None:
+                problematic_count = sum(
+                    1 for s in stats if s.optimization_priority >= Priority.HIGH
+                )
+            avg_duration = float(durations.mean())
+            total_runs = int(run_counts.sum())
+        else:
+            problematic_count = 0
+            avg_duration = 0
+            total_runs = 0
         
         return {
             'total_workflows': total_workflows,
-            'problematic_workflows': problematic_workflows,
+            'problematic_workflows': problematic_count,
             'total_repositories': len(repo_summary),
             'avg_duration_minutes': round(avg_duration, 1),
             'total_runs_analyzed': total_runs,
@@ -1,18 +1,102 @@
+import atexit
 import os
+import re
 import requests
+import shelve
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs, urlparse
 
+import yaml
+try:
+    # The C loader parses 3-5x faster; fall back when libyaml is absent
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# One compiled scan finds every trigger keyword instead of four separate
+# substring passes; keyword -> (analysis flag, frequency score)
+_TRIGGER_RE = re.compile(r'pull_request|workflow_dispatch|schedule|push')
+_TRIGGER_KEYWORDS = {
+    'pull_request': ('is_pr_triggered', 3),        # High frequency
+    'push': ('is_push_triggered', 2),              # Medium-high frequency
+    'schedule': ('is_schedule_triggered', 1),      # Low-medium frequency
+    'workflow_dispatch': ('is_manual_triggered', 0),  # No frequency score
+}
+
+
+@lru_cache(maxsize=2048)
+def _analyze_triggers_cached(content: Optional[str]) -> MappingProxyType:
+    """Memoized trigger analysis; pure in the file content.
+
+    Reusable workflows repeat verbatim across forks and templated repos,
+    so identical content short-circuits the parse. The result is shared
+    between every run of a workflow, hence the read-only mapping.
+    """
+    analysis = {
+        'is_pr_triggered': False,
+        'is_push_triggered': False,
+        'is_schedule_triggered': False,
+        'is_manual_triggered': False,
+        'trigger_frequency_score': 0,
+        'raw_triggers': []
+    }
+
+    if not content:
+        return MappingProxyType(analysis)
+
+    try:
+        workflow_data = yaml.load(content, Loader=_YamlLoader)
+
+        if 'on' in workflow_data:
+            triggers = workflow_data['on']
+
+            # Handle different trigger formats
+            if isinstance(triggers, str):
+                triggers = [triggers]
+            elif isinstance(triggers, dict):
+                triggers = list(triggers.keys())
+            elif isinstance(triggers, list):
+                pass  # Already a list
+            else:
+                triggers = []
+
+            analysis['raw_triggers'] = triggers
+
+            # One regex sweep over the joined trigger names tags all
+            # trigger types and accumulates the frequency scores
+            for match in _TRIGGER_RE.finditer(' '.join(map(str, triggers)).lower()):
+                flag, score = _TRIGGER_KEYWORDS[match.group(0)]
+                analysis[flag] = True
+                analysis['trigger_frequency_score'] += score
+
+    except Exception:
+        # If YAML parsing fails, fall back to text analysis: each
+        # keyword found anywhere in the file counts once
+        for keyword in set(_TRIGGER_RE.findall(content.lower())):
+            flag, score = _TRIGGER_KEYWORDS[keyword]
+            analysis[flag] = True
+            analysis['trigger_frequency_score'] += score
+
+    return MappingProxyType(analysis)
+
+
+@dataclass(slots=True)
 class WorkflowRun:
     id: int
     name: str
     status: str
     conclusion: str
     duration_seconds: int
+    # Derived once at construction; the analyzer reads durations in minutes
+    # far more often than runs are created
+    duration_minutes: float = field(init=False)
     created_at: datetime
     updated_at: datetime
     repository: str
@@ -22,6 +106,9 @@ class WorkflowRun:
     workflow_content: Optional[str] = None
     trigger_analysis: Optional[Dict] = None
 
+    def __post_init__(self):
+        self.duration_minutes = self.duration_seconds / 60.0
+
 
 class GitHubClient:
     def __init__(self, token: Optional[str] = None):
@@ -35,27 +122,148 @@ class GitHubClient:
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'workflow-analyzer-tool'
         })
+        # The default adapter keeps 10 pooled connections; the repo- and
+        # workflow-level thread pools can exceed that, and an exhausted pool
+        # silently falls back to a new TCP+TLS handshake per request
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        # The repo, workflow and page thread pools nest, so their worker
+        # counts multiply; this gate caps aggregate in-flight requests at
+        # the adapter's pool size, well under GitHub's ~100-concurrent
+        # secondary limit
+        self._request_gate = threading.BoundedSemaphore(16)
         self.base_url = 'https://api.github.com'
+        # url -> (etag, content) for workflow files; a 304 on the
+        # If-None-Match revalidation skips the body transfer and decode
+        self._etag_cache: Dict[str, tuple] = {}
+        # On-disk counterpart for listing pages so revalidation survives
+        # between invocations; fall back to in-memory when the cache file
+        # can't be opened (e.g. a read-only checkout). Closed at exit so
+        # the dbm backend flushes its writes. The dbm backends are not
+        # thread-safe and the listing pools hit the cache concurrently,
+        # hence the lock around every read and write.
+        try:
+            self._listing_cache = shelve.open('.gh_etag_cache')
+            atexit.register(self._listing_cache.close)
+        except Exception:
+            self._listing_cache = {}
+        self._listing_lock = threading.Lock()
+        # Last-seen primary rate-limit state, refreshed from every response
+        # so requests pace themselves before hitting the cap (benign races
+        # between worker threads only make the pacing slightly conservative)
+        self._rl_remaining = 5000
+        self._rl_reset = 0.0
     
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
-        """Make authenticated request to GitHub API with rate limit handling."""
-        response = self.session.get(url, params=params)
-        
-        # Handle rate limiting
+    def _make_request_full(self, url: str, params: Optional[Dict] = None,
+                           headers: Optional[Dict] = None) -> requests.Response:
+        """Make an authenticated request and return the full response.
+
+        When the remaining quota runs low, requests spread themselves over
+        the time left until the reset instead of bursting into the cap and
+        stalling on a long reactive sleep.
+        """
+        if self._rl_remaining < 50:
+            pause = (self._rl_reset - time.time()) / max(self._rl_remaining, 1)
+            if pause > 0:
+                time.sleep(min(pause, 60.0))
+
+        with self._request_gate:
+            response = self.session.get(url, params=params, headers=headers)
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            self._rl_remaining = int(remaining)
+            self._rl_reset = float(response.headers.get('X-RateLimit-Reset', self._rl_reset))
+
+        # Handle rate limiting reactively as a last resort. Secondary
+        # (abuse) limits send Retry-After - honor it instead of sleeping
+        # until the primary quota reset, which can be an hour away
         if response.status_code == 403 and 'rate limit' in response.text.lower():
-            reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
-            sleep_time = max(reset_time - int(time.time()), 0) + 1
+            retry_after = response.headers.get('Retry-After')
+            if retry_after is not None:
+                sleep_time = int(retry_after) + 1
+            else:
+                reset_time = int(response.headers.get('X-RateLimit-Reset', 0))
+                sleep_time = max(reset_time - int(time.time()), 0) + 1
             print(f"Rate limit exceeded. Sleeping for {sleep_time} seconds...")
             time.sleep(sleep_time)
-            response = self.session.get(url, params=params)
-        
+            with self._request_gate:
+                response = self.session.get(url, params=params, headers=headers)
+
         response.raise_for_status()
-        return response.json()
+        return response
+
+    def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
+        """Make authenticated request to GitHub API with rate limit handling."""
+        return self._make_request_full(url, params).json()
+
+    def _cached_listing(self, url: str, params: Optional[Dict] = None) -> tuple:
+        """Fetch one listing page through the persistent ETag cache.
+
+        Repository and workflow listings rarely change between invocations
+        of the tool; revalidating with If-None-Match turns an unchanged
+        page into a bodyless 304 that does not count against the rate
+        limit. Returns (data, last_page).
+        """
+        key = f"{url}?{sorted((params or {}).items())!r}"
+        with self._listing_lock:
+            try:
+                cached = self._listing_cache.get(key)
+            except Exception:
+                # A corrupt or unreadable entry just means a full refetch
+                cached = None
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self._make_request_full(url, params, headers=headers)
+
+        if response.status_code == 304:
+            return cached[1], cached[2]
+
+        data = response.json()
+        last_page = self._last_page(response)
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._listing_lock:
+                try:
+                    self._listing_cache[key] = (etag, data, last_page)
+                except Exception:
+                    # A failed cache write must not fail the listing
+                    pass
+        return data, last_page
+
+    @staticmethod
+    def _last_page(response: requests.Response) -> int:
+        """Total page count from the Link rel="last" header (1 when absent)."""
+        last = response.links.get('last')
+        if not last:
+            return 1
+        try:
+            return int(parse_qs(urlparse(last['url']).query)['page'][0])
+        except (KeyError, ValueError, IndexError):
+            return 1
+
+    def _fetch_pages(self, url: str, params: Dict, last_page: int,
+                     cached: bool = False) -> List[Dict]:
+        """Fetch pages 2..last_page concurrently, preserving page order.
+
+        GitHub reports the total page count up front in the Link header,
+        so the remaining pages need not be discovered one RTT at a time.
+        Pass cached=True to route listing pages through the ETag cache.
+        """
+        if last_page <= 1:
+            return []
+        fetch = ((lambda u, p: self._cached_listing(u, p)[0]) if cached
+                 else self._make_request)
+        with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as executor:
+            futures = [
+                executor.submit(fetch, url, {**params, 'page': page})
+                for page in range(2, last_page + 1)
+            ]
+            return [future.result() for future in futures]
     
     def get_repository_workflows(self, repo: str) -> List[Dict]:
         """Get all workflows for a repository."""
         url = f"{self.base_url}/repos/{repo}/actions/workflows"
-        data = self._make_request(url)
+        data, _ = self._cached_listing(url)
         return [w for w in data['workflows'] if w['state'] == 'active']
     
     def get_workflow_runs(self, repo: str, workflow_id: int, days: int = 15) -> List[WorkflowRun]:
@@ -68,21 +276,22 @@ class GitHubClient:
             'per_page': 100,
             'created': f'>{since}'
         }
-        
+
+        # Page 1 carries the total page count in its Link header; the rest
+        # of the pages are fetched concurrently instead of one RTT each.
+        # Safety limit of 10 pages as before.
+        first = self._make_request_full(url, {**params, 'page': 1})
+        pages = [first.json()]
+        pages.extend(self._fetch_pages(url, params, min(self._last_page(first), 10)))
+
         runs = []
-        page = 1
-        
-        while True:
-            params['page'] = page
-            data = self._make_request(url, params)
-            
-            if not data['workflow_runs']:
-                break
-                
+        for data in pages:
             for run in data['workflow_runs']:
                 if run['conclusion'] == 'success':
-                    created_at = datetime.fromisoformat(run['created_at'].replace('Z', '+00:00'))
-                    updated_at = datetime.fromisoformat(run['updated_at'].replace('Z', '+00:00'))
+                    # fromisoformat accepts the Z suffix directly on the
+                    # Python 3.11 this tool runs on - no per-run string copy
+                    created_at = datetime.fromisoformat(run['created_at'])
+                    updated_at = datetime.fromisoformat(run['updated_at'])
                     duration = int((updated_at - created_at).total_seconds())
                     
                     runs.append(WorkflowRun(
@@ -98,62 +307,40 @@ class GitHubClient:
                         event=run['event'],
                         branch=run['head_branch'] or 'unknown'
                     ))
-            
-            # Check if there are more pages
-            if len(data['workflow_runs']) < 100:
-                break
-            page += 1
-            
-            # Safety limit
-            if page > 10:
-                break
-        
+
         return runs
     
     def get_organization_repositories(self, org: str, repo_filter: str = "*") -> List[str]:
         """Get all repositories for an organization."""
         url = f"{self.base_url}/orgs/{org}/repos"
         repos = []
-        page = 1
-        
+        params = {'type': 'all', 'per_page': 100}
+
         print(f"Discovering repositories in organization: {org}")
-        
-        while True:
-            params = {
-                'type': 'all',
-                'per_page': 100,
-                'page': page
-            }
-            
-            try:
-                data = self._make_request(url, params)
-                
-                if not data:
-                    break
-                
+
+        try:
+            first_data, last_page = self._cached_listing(url, {**params, 'page': 1})
+            pages = [first_data]
+
+            # Safety limit to prevent excessive API calls
+            if last_page > 50:
+                print(f"Warning: Stopped at page 50 of {last_page} to prevent excessive API calls")
+                last_page = 50
+            pages.extend(self._fetch_pages(url, params, last_page, cached=True))
+
+            for data in pages:
                 for repo in data:
                     # Skip archived repositories by default
                     if not repo.get('archived', False):
                         repo_name = repo['full_name']
-                        
+
                         # Apply filter if not "*"
                         if repo_filter == "*" or repo_filter in repo_name:
                             repos.append(repo_name)
-                
-                # Check if there are more pages
-                if len(data) < 100:
-                    break
-                page += 1
-                
-                # Safety limit to prevent infinite loops
-                if page > 50:
-                    print(f"Warning: Stopped at page {page} to prevent excessive API calls")
-                    break
-                    
-            except Exception as e:
-                print(f"Error fetching repositories for org {org}: {e}")
-                break
-        
+
+        except Exception as e:
+            print(f"Error fetching repositories for org {org}: {e}")
+
         print(f"Found {len(repos)} repositories in {org}")
         return repos
     
@@ -168,109 +355,109 @@ class GitHubClient:
             if not workflow_path:
                 return None
             
-            # Get the file content
+            # Get the file content, revalidating against the cached ETag;
+            # a 304 reuses the cached content without counting against
+            # the rate limit. The raw media type returns the file body
+            # directly - no JSON envelope, no base64 round-trip
             file_url = f"{self.base_url}/repos/{repo}/contents/{workflow_path}"
-            file_data = self._make_request(file_url)
-            
-            if file_data.get('content'):
-                import base64
-                content = base64.b64decode(file_data['content']).decode('utf-8')
-                return content
-                
+            cached = self._etag_cache.get(file_url)
+            headers = {'Accept': 'application/vnd.github.raw'}
+            if cached:
+                headers['If-None-Match'] = cached[0]
+            # Through _make_request_full so these fetches get the same
+            # pacing, gating and 403 backoff as every other request; a
+            # 304 passes its raise_for_status untouched
+            response = self._make_request_full(file_url, headers=headers)
+
+            if response.status_code == 304:
+                return cached[1]
+
+            content = response.text
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etag_cache[file_url] = (etag, content)
+            return content
+
         except Exception as e:
             # Silently fail for workflow content - not critical
             pass
         
         return None
     
+    def _fetch_workflow_bundle(self, repo: str, workflow: Dict, days: int) -> List[WorkflowRun]:
+        """Fetch the runs and file content for one workflow and attach triggers."""
+        print(f"  Fetching runs for workflow: {workflow['name']}")
+        runs = self.get_workflow_runs(repo, workflow['id'], days)
+
+        # Get workflow file content and analyze triggers once per workflow;
+        # every run shares the same analysis by reference. Copied out of the
+        # memoized read-only mapping because runs get pickled by the run
+        # cache and mappingproxy objects don't pickle
+        workflow_content = self.get_workflow_file_content(repo, workflow['id'])
+        trigger_analysis = dict(self._analyze_workflow_triggers(workflow_content))
+
+        for run in runs:
+            run.workflow_content = workflow_content
+            run.trigger_analysis = trigger_analysis
+
+        return runs
+
     def get_all_repository_runs(self, repo: str, days: int = 15) -> List[WorkflowRun]:
-        """Get all workflow runs for a repository."""
+        """Get all workflow runs for a repository.
+
+        The per-workflow fetches (runs listing plus the workflow file) are
+        independent API round-trips, so they fan out over a small thread
+        pool just like the per-repository fetches one level up.
+        """
         workflows = self.get_repository_workflows(repo)
-        all_runs = []
-        
+        if not workflows:
+            return []
+
         print(f"Analyzing {len(workflows)} workflows in {repo}...")
-        
-        for workflow in workflows:
-            print(f"  Fetching runs for workflow: {workflow['name']}")
-            runs = self.get_workflow_runs(repo, workflow['id'], days)
-            
-            # Get workflow file content to analyze triggers
-            workflow_content = self.get_workflow_file_content(repo, workflow['id'])
-            
-            # Enhance runs with trigger analysis
-            for run in runs:
-                run.workflow_content = workflow_content
-                run.trigger_analysis = self._analyze_workflow_triggers(workflow_content)
-            
-            all_runs.extend(runs)
-            
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
-        
+
+        all_runs = []
+        workers = min(8, len(workflows))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._fetch_workflow_bundle, repo, workflow, days)
+                for workflow in workflows
+            ]
+            for future in as_completed(futures):
+                all_runs.extend(future.result())
+
         return all_runs
     
-    def _analyze_workflow_triggers(self, content: Optional[str]) -> Dict[str, any]:
+    def get_runs_for_repositories(self, repos: List[str], days: int = 15, max_workers: int = 20) -> List[WorkflowRun]:
+        """Get workflow runs for multiple repositories concurrently.
+
+        The per-repository work is purely I/O-bound on GitHub API latency,
+        so a bounded thread pool overlaps the network round-trips instead
+        of paying for them sequentially.
+        """
+        if not repos:
+            return []
+
+        all_runs = []
+        workers = min(max_workers, len(repos))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_repo = {
+                executor.submit(self.get_all_repository_runs, repo, days): repo
+                for repo in repos
+            }
+
+            for i, future in enumerate(as_completed(future_to_repo), 1):
+                repo = future_to_repo[future]
+                try:
+                    runs = future.result()
+                    all_runs.extend(runs)
+                    print(f"[{i}/{len(repos)}] {repo}: found {len(runs)} workflow runs")
+                except Exception as e:
+                    print(f"[{i}/{len(repos)}] {repo}: error: {e}")
+
+        return all_runs
+
+    def _analyze_workflow_triggers(self, content: Optional[str]) -> MappingProxyType:
         """Analyze workflow file content to determine trigger patterns."""
-        analysis = {
-            'is_pr_triggered': False,
-            'is_push_triggered': False,
-            'is_schedule_triggered': False,
-            'is_manual_triggered': False,
-            'trigger_frequency_score': 0,
-            'raw_triggers': []
-        }
-        
-        if not content:
-            return analysis
-        
-        try:
-            import yaml
-            workflow_data = yaml.safe_load(content)
-            
-            if 'on' in workflow_data:
-                triggers = workflow_data['on']
-                
-                # Handle different trigger formats
-                if isinstance(triggers, str):
-                    triggers = [triggers]
-                elif isinstance(triggers, dict):
-                    triggers = list(triggers.keys())
-                elif isinstance(triggers, list):
-                    pass  # Already a list
-                else:
-                    triggers = []
-                
-                analysis['raw_triggers'] = triggers
-                
-                # Analyze trigger types and assign frequency scores
-                for trigger in triggers:
-                    if 'pull_request' in str(trigger).lower():
-                        analysis['is_pr_triggered'] = True
-                        analysis['trigger_frequency_score'] += 3  # High frequency
-                    
-                    if 'push' in str(trigger).lower():
-                        analysis['is_push_triggered'] = True
-                        analysis['trigger_frequency_score'] += 2  # Medium-high frequency
-                    
-                    if 'schedule' in str(trigger).lower():
-                        analysis['is_schedule_triggered'] = True
-                        analysis['trigger_frequency_score'] += 1  # Low-medium frequency
-                    
-                    if 'workflow_dispatch' in str(trigger).lower():
-                        analysis['is_manual_triggered'] = True
-                        # No frequency score for manual triggers
-                
-        except Exception as e:
-            # If YAML parsing fails, fall back to text analysis
-            content_lower = content.lower()
-            if 'pull_request' in content_lower:
-                analysis['is_pr_triggered'] = True
-                analysis['trigger_frequency_score'] += 3
-            if 'push' in content_lower:
-                analysis['is_push_triggered'] = True
-                analysis['trigger_frequency_score'] += 2
-            if 'schedule' in content_lower:
-                analysis['is_schedule_triggered'] = True
-                analysis['trigger_frequency_score'] += 1
-        
-        return analysis
\ No newline at end of file
+        return _analyze_triggers_cached(content)
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Shared dashboard output helpers for the entry-point scripts."""
+
+import hashlib
+import shutil
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+
+_ROOT_DIR = Path(__file__).parent.parent
+
+# Build the Jinja environment once at import time. The bytecode cache persists
+# compiled templates between runs and auto_reload=False skips the mtime check
+# on every render.
+_JINJA_CACHE_DIR = Path('.jinja_cache')
+_JINJA_CACHE_DIR.mkdir(exist_ok=True)
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(_ROOT_DIR / 'templates'),
+    bytecode_cache=FileSystemBytecodeCache(directory=str(_JINJA_CACHE_DIR)),
+    auto_reload=False,
+    # Escape the workflow/repository names interpolated into the page;
+    # escaping runs in markupsafe's C speedups and the chart HTML is
+    # already marked |safe in the template
+    autoescape=select_autoescape()
+)
+_DASHBOARD_TEMPLATE = _JINJA_ENV.get_template('dashboard.html')
+
+
+def write_dashboard(title, charts, summary, workflows, repositories, output_path):
+    """Render the dashboard template and stream it to output_path.
+
+    Streaming writes the template in chunks instead of materializing the
+    whole page in memory first.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _DASHBOARD_TEMPLATE.stream(
+        title=title,
+        charts=charts,
+        summary=summary,
+        workflows=workflows,
+        repositories=repositories
+    ).dump(str(output_path), encoding='utf-8')
+
+
+def sync_images(images_dst, images_src=_ROOT_DIR / 'images'):
+    """Copy the images directory, skipping the copy when nothing changed.
+
+    A fingerprint of the source tree (paths, sizes, mtimes) is stored next
+    to the copied files; when it matches, the rmtree+copytree is skipped.
+    """
+    if not images_src.exists():
+        return
+
+    digest = hashlib.blake2b(repr(sorted(
+        (p.relative_to(images_src).as_posix(), p.stat().st_size, int(p.stat().st_mtime))
+        for p in images_src.rglob('*') if p.is_file()
+    )).encode(), digest_size=16).hexdigest()
+    marker = images_dst / '.sync_hash'
+
+    if images_dst.exists() and marker.exists() and marker.read_text() == digest:
+        print(f"Images unchanged, skipping copy to {images_dst}")
+        return
+
+    if images_dst.exists():
+        shutil.rmtree(images_dst)
+    shutil.copytree(images_src, images_dst)
+    marker.write_text(digest)
+    print(f"Copied images to {images_dst}")